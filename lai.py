@@ -1,13 +1,26 @@
-import math
+import array
+import functools
+import hashlib
+import mmap
 import json
 import os
+import sys
 
-from pqcrypto import keygen, encrypt, decrypt
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
+from pqcrypto import keygen, encrypt_batch, decrypt
 
 p = 10007
 a = 5
 P0 = (1, 0)
 
+# Buffer size for the stdlib JSON writer, which emits many small strings.
+JSON_WRITE_BUFFER = 16 * 1024
+
+@functools.lru_cache(maxsize=None)
 def max_block_size(p: int) -> int:
     """
     Compute B = floor((bit_length(p) - 1) / 8),
@@ -16,22 +29,33 @@ def max_block_size(p: int) -> int:
     bit_len = p.bit_length()
     return (bit_len - 1) // 8
 
-def file_to_int_blocks(filepath: str, p: int) -> list[int]:
+# Block sizes (in bytes) that map onto an unsigned array typecode.
+_ARRAY_TYPECODES = {array.array(code).itemsize: code for code in "QLIHB"}
+
+def _buffer_to_int_blocks(raw, p: int, B: int) -> list[int]:
     """
-    1. Read the entire file as bytes.
-    2. Split it into chunks of length B = max_block_size(p).
-    3. Convert each chunk to an integer with int.from_bytes(..., 'big').
-    4. Assert each integer < p.
+    Split a bytes-like buffer into B-byte big-endian integers, asserting each < p.
     """
-    with open(filepath, "rb") as f:
-        raw = f.read()
-
-    B = max_block_size(p)
-    if B < 1:
-        raise ValueError("Prime p is too small; block size < 1 byte.")
+    code = _ARRAY_TYPECODES.get(B)
+    if code is not None:
+        # B matches a native unsigned int width: decode all whole blocks in
+        # one pass with array, then fix the byte order to big-endian.
+        n_full = len(raw) // B
+        arr = array.array(code)
+        arr.frombytes(raw[:n_full * B])
+        if sys.byteorder == "little" and B > 1:
+            arr.byteswap()
+        blocks = arr.tolist()
+        tail = raw[n_full * B:]
+        if len(tail):
+            blocks.append(int.from_bytes(tail, byteorder="big"))
+        if blocks and max(blocks) >= p:
+            i = next(i for i, m_int in enumerate(blocks) if m_int >= p)
+            raise ValueError(f"Block integer ≥ p! Check block size. (block index {i})")
+        return blocks
 
     blocks = []
-    n_blocks = math.ceil(len(raw) / B)
+    n_blocks = (len(raw) + B - 1) // B
     for i in range(n_blocks):
         start = i * B
         end = start + B
@@ -43,28 +67,68 @@ def file_to_int_blocks(filepath: str, p: int) -> list[int]:
 
     return blocks
 
-def encrypt_js_file(js_path: str, output_json: str, p: int, a: int, P0: tuple[int,int]) -> None:
+def file_to_int_blocks(filepath: str, p: int) -> tuple[list[int], bytes]:
+    """
+    1. Memory-map the file read-only (no up-front read() copy).
+    2. Split it into chunks of length B = max_block_size(p).
+    3. Convert each chunk to an integer with int.from_bytes(..., 'big').
+    4. Assert each integer < p.
+    Return (blocks, SHA-256 digest of the file contents).
+    """
+    B = max_block_size(p)
+    if B < 1:
+        raise ValueError("Prime p is too small; block size < 1 byte.")
+
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], hashlib.sha256().digest()  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as raw:
+            return _buffer_to_int_blocks(raw, p, B), hashlib.sha256(raw).digest()
+
+def _dump_json(result: dict, path: str) -> None:
+    """
+    Write result as compact JSON (no indentation), using orjson when available.
+    """
+    if orjson is not None:
+        with open(path, "wb") as fout:
+            fout.write(orjson.dumps(result))
+    else:
+        with open(path, "w", encoding="utf-8", buffering=JSON_WRITE_BUFFER) as fout:
+            # Match orjson's output: no spaces after ',' and ':'
+            json.dump(result, fout, separators=(",", ":"))
+
+def _load_json(path: str) -> dict:
+    """
+    Read a JSON file written by _dump_json.
+    """
+    if orjson is not None:
+        with open(path, "rb") as fin:
+            return orjson.loads(fin.read())
+    with open(path, "r", encoding="utf-8") as fin:
+        return json.load(fin)
+
+def encrypt_js_file(js_path: str, output_json: str, p: int, a: int, P0: tuple[int,int]) -> bytes:
     """
     1) Generate (k, Q) via keygen.
     2) Read js_path, split into integer blocks.
-    3) Encrypt each block → (C1, C2, r).
+    3) Tabulate T^r(P0) and T^r(Q) once, then encrypt each block → (C1, C2, r).
     4) Write p, a, P0, k, Q, blocks into output_json.
+    Return the SHA-256 digest of js_path, for verifying a later decryption.
     """
     # Generate keypair
     k, Q = keygen(p, a, P0)
 
     # Split file into int blocks
-    m_blocks = file_to_int_blocks(js_path, p)
-
-    ciphertext_blocks = []
-    for m_int in m_blocks:
-        # encrypt expects exactly 6 args: (m_int, public_Q, private_k, p, a, P0)
-        C1, C2, r = encrypt(m_int, Q, k, p, a, P0)
-        ciphertext_blocks.append({
-            "C1": [C1[0], C1[1]],
-            "C2": [C2[0], C2[1]],
-            "r": r
-        })
+    m_blocks, digest = file_to_int_blocks(js_path, p)
+
+    # T^r(P0) and T^r(Q) only depend on r: encrypt_batch tabulates them once
+    # for all blocks, which leaves too little per-block work for a process pool
+    rows = encrypt_batch(m_blocks, Q, k, p, a, P0)
+
+    # Columnar (struct-of-arrays) layout: one flat list per field
+    # instead of a dict plus three lists per block.
+    fields = ("C1x", "C1y", "C2x", "C2y", "r")
+    ciphertext_blocks = {name: [row[i] for row in rows] for i, name in enumerate(fields)}
 
     # Bundle into JSON
     result = {
@@ -75,9 +139,45 @@ def encrypt_js_file(js_path: str, output_json: str, p: int, a: int, P0: tuple[in
         "Q": [Q[0], Q[1]],
         "blocks": ciphertext_blocks
     }
-    with open(output_json, "w", encoding="utf-8") as fout:
-        json.dump(result, fout, indent=2)
+    _dump_json(result, output_json)
     print(f"✅ File ciphertext written to '{output_json}'.")
+    return digest
+
+def verify_json_file(output_json: str, js_path: str, original_digest: bytes) -> None:
+    """
+    1) Load output_json and decrypt every block.
+    2) Reassemble the blocks into raw bytes (B bytes per block).
+    3) Compare the SHA-256 of the result, truncated to the size of js_path,
+       with original_digest. Raise RuntimeError on mismatch.
+    """
+    loaded = _load_json(output_json)
+
+    # Decrypt and reassemble into raw bytes in a single pass; hoist the
+    # per-file values and decrypt into locals for the loop
+    k_, a_, p_ = loaded["k"], loaded["a"], loaded["p"]
+    dec = decrypt
+    B = max_block_size(p_)
+    blocks = loaded["blocks"]
+    # The output size is known up front: fill a preallocated buffer by slice
+    all_bytes = bytearray(len(blocks["r"]) * B)
+    for i, (x1, y1, x2, y2, r_val) in enumerate(zip(blocks["C1x"], blocks["C1y"],
+                                                    blocks["C2x"], blocks["C2y"],
+                                                    blocks["r"])):
+        # decrypt expects: (C1_tuple, C2_tuple, private_k, r, a, p)
+        m_int = dec((x1, y1), (x2, y2), k_, r_val, a_, p_)
+        if m_int < 0 or m_int >= p_:
+            raise ValueError(f"Decrypted integer out of range: {m_int}")
+        # to_bytes left-pads with zeros to length B, and raises if m_int needs more
+        try:
+            all_bytes[i * B:(i + 1) * B] = m_int.to_bytes(B, byteorder="big")
+        except OverflowError:
+            raise ValueError(f"Block at integer {m_int} is longer than B bytes") from None
+
+    # Compare to the original by digest, without reading the JS file again
+    original_size = os.path.getsize(js_path)
+    decrypted_digest = hashlib.sha256(memoryview(all_bytes)[:original_size]).digest()
+    if decrypted_digest != original_digest:
+        raise RuntimeError("❌ Decryption mismatch: decrypted content != original JS")
 
 if __name__ == "__main__":
     repo_root = os.getcwd()
@@ -85,47 +185,8 @@ if __name__ == "__main__":
     output_json = os.path.join(repo_root, "script.min.json")
 
     # 1) Encrypt → script.min.json
-    encrypt_js_file(js_path, output_json, p, a, P0)
+    original_digest = encrypt_js_file(js_path, output_json, p, a, P0)
 
     # 2) Immediately verify by decrypting
-    with open(output_json, "r", encoding="utf-8") as fin:
-        loaded = json.load(fin)
-
-    def max_block_size_int(p_val: int) -> int:
-        return (p_val.bit_length() - 1) // 8
-
-    decrypted_int_blocks = []
-    for blk in loaded["blocks"]:
-        x1, y1 = blk["C1"]
-        x2, y2 = blk["C2"]
-        r_val = blk["r"]
-        # decrypt expects: (C1_tuple, C2_tuple, private_k, r, a, p)
-        m_int = decrypt((x1, y1), (x2, y2),
-                        loaded["k"], r_val,
-                        loaded["a"], loaded["p"])
-        decrypted_int_blocks.append(m_int)
-
-    # Reassemble into raw bytes
-    B = max_block_size_int(loaded["p"])
-    all_bytes = bytearray()
-    for m_int in decrypted_int_blocks:
-        if m_int < 0 or m_int >= loaded["p"]:
-            raise ValueError(f"Decrypted integer out of range: {m_int}")
-        if m_int == 0:
-            chunk = b"\x00"
-        else:
-            byte_len = math.ceil(m_int.bit_length() / 8)
-            chunk = m_int.to_bytes(byte_len, byteorder="big")
-        if len(chunk) > B:
-            raise ValueError(f"Block at integer {m_int} is longer than B bytes")
-        # Pad on the left with zeros to length B
-        chunk = chunk.rjust(B, b"\x00")
-        all_bytes.extend(chunk)
-
-    # Compare to the original
-    with open(js_path, "rb") as fin_js:
-        original_bytes = fin_js.read()
-    decrypted_bytes = bytes(all_bytes[: len(original_bytes)])
-    if decrypted_bytes != original_bytes:
-        raise RuntimeError("❌ Decryption mismatch: decrypted content != original JS")
+    verify_json_file(output_json, js_path, original_digest)
     print("✅ Decryption successful: plaintext matches script.min.js exactly.")
@@ -149,17 +149,23 @@ namespace PQCrypto
 
             int bitLen = (int)Math.Floor(BigInteger.Log(p, 2)) + 1;
             int B = (bitLen - 1) / 8;
-            var blocks = (IEnumerable<dynamic>)laiData.blocks;
+            // blocks berbentuk kolom: { C1x: [...], C1y: [...], C2x: [...], C2y: [...], r: [...] }
+            var blocks = laiData.blocks;
+            var C1x = ((IEnumerable<dynamic>)blocks.C1x).ToList();
+            var C1y = ((IEnumerable<dynamic>)blocks.C1y).ToList();
+            var C2x = ((IEnumerable<dynamic>)blocks.C2x).ToList();
+            var C2y = ((IEnumerable<dynamic>)blocks.C2y).ToList();
+            var rs = ((IEnumerable<dynamic>)blocks.r).ToList();
 
             using (var ms = new System.IO.MemoryStream())
             {
-                foreach (var blk in blocks)
+                for (int i = 0; i < rs.Count; i++)
                 {
-                    BigInteger x1 = (BigInteger)blk.C1[0];
-                    BigInteger y1 = (BigInteger)blk.C1[1];
-                    BigInteger x2 = (BigInteger)blk.C2[0];
-                    BigInteger y2 = (BigInteger)blk.C2[1];
-                    BigInteger r = (BigInteger)blk.r;
+                    BigInteger x1 = (BigInteger)C1x[i];
+                    BigInteger y1 = (BigInteger)C1y[i];
+                    BigInteger x2 = (BigInteger)C2x[i];
+                    BigInteger y2 = (BigInteger)C2y[i];
+                    BigInteger r = (BigInteger)rs[i];
 
                     var M_int = DecryptBlock((x1, y1), (x2, y2), k, r, a, p);
                     byte[] mBytesLittle = M_int.ToByteArray();
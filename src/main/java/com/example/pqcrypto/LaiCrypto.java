@@ -4,7 +4,6 @@ import java.math.BigInteger;
 import java.security.MessageDigest;
 import java.security.NoSuchAlgorithmException;
 import java.security.SecureRandom;
-import java.util.Iterator;
 
 import com.fasterxml.jackson.databind.JsonNode;
 
@@ -153,15 +152,18 @@ public class LaiCrypto {
         }
 
         java.io.ByteArrayOutputStream baos = new java.io.ByteArrayOutputStream();
-        for (Iterator<JsonNode> it = blocks.elements(); it.hasNext(); ) {
-            JsonNode blk = it.next();
-            JsonNode C1n = blk.get("C1");
-            JsonNode C2n = blk.get("C2");
-            BigInteger x1 = new BigInteger(C1n.get(0).asText());
-            BigInteger y1 = new BigInteger(C1n.get(1).asText());
-            BigInteger x2 = new BigInteger(C2n.get(0).asText());
-            BigInteger y2 = new BigInteger(C2n.get(1).asText());
-            BigInteger rBlock = new BigInteger(blk.get("r").asText());
+        // blocks is columnar: { "C1x": [...], "C1y": [...], "C2x": [...], "C2y": [...], "r": [...] }
+        JsonNode C1x = blocks.get("C1x");
+        JsonNode C1y = blocks.get("C1y");
+        JsonNode C2x = blocks.get("C2x");
+        JsonNode C2y = blocks.get("C2y");
+        JsonNode rs = blocks.get("r");
+        for (int i = 0; i < rs.size(); i++) {
+            BigInteger x1 = new BigInteger(C1x.get(i).asText());
+            BigInteger y1 = new BigInteger(C1y.get(i).asText());
+            BigInteger x2 = new BigInteger(C2x.get(i).asText());
+            BigInteger y2 = new BigInteger(C2y.get(i).asText());
+            BigInteger rBlock = new BigInteger(rs.get(i).asText());
 
             Point C1 = new Point(x1, y1);
             Point C2 = new Point(x2, y2);
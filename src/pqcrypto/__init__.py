@@ -8,8 +8,11 @@ from .lai import (
     H,
     sqrt_mod,
     T,
+    T_table,
     keygen,
     encrypt,
+    encrypt_with_table,
+    encrypt_batch,
     decrypt,
 )
 
@@ -17,9 +20,12 @@ __all__ = [
     "H",
     "sqrt_mod",
     "T",
+    "T_table",
     "keygen",
     "encrypt",
+    "encrypt_with_table",
+    "encrypt_batch",
     "decrypt",
 ]
 
-__version__ = "0.1.5"
+__version__ = "0.2.1"
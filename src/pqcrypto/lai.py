@@ -9,7 +9,7 @@ Quantum-Resistant Cryptography via Lemniscate Lattices and AGM Transformations.
 
 import hashlib
 import secrets
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 
 def H(x: int, y: int, s: int, p: int) -> int:
@@ -31,16 +31,18 @@ def sqrt_mod(a: int, p: int) -> Optional[int]:
     if a == 0:
         return 0
 
+    # Kasus cepat jika p ≡ 3 (mod 4): satu eksponensiasi, lalu cek r^2 ≡ a
+    # (menggantikan uji Legendre yang terpisah).
+    if p % 4 == 3:
+        r = pow(a, (p + 1) // 4, p)
+        return r if (r * r) % p == a else None
+
     # Legendre symbol: a^((p-1)//2) mod p
     ls = pow(a, (p - 1) // 2, p)
     if ls == p - 1:
         # Non-residu → tidak ada akar kuadrat
         return None
 
-    # Kasus cepat jika p ≡ 3 (mod 4)
-    if p % 4 == 3:
-        return pow(a, (p + 1) // 4, p)
-
     # Tonelli–Shanks untuk p ≡ 1 (mod 4)
     q = p - 1
     s = 0
@@ -89,7 +91,7 @@ def T(point: Tuple[int, int], s: int, a: int, p: int) -> Tuple[int, int]:
     Jika sqrt_mod gagal (None), naikkan s (fallback) hingga 10 kali.
     """
     x, y = point
-    inv2 = pow(2, p - 2, p)  # invers dari 2 mod p
+    inv2 = (p + 1) // 2  # invers dari 2 mod p (p ganjil), tanpa pow(2, p-2, p)
 
     trials = 0
     s_current = s
@@ -130,6 +132,28 @@ def _pow_T_range(P: Tuple[int, int], start_s: int, exp: int, a: int, p: int) ->
     return result
 
 
+def T_table(P: Tuple[int, int], start_s: int, n: int, a: int, p: int) -> List[Tuple[int, int]]:
+    """
+    Tabel orbit T untuk titik basis tetap P:
+      table[i] = T^(i+1)(P) dengan seed index start_s..start_s+i,
+      untuk i = 0 .. n-1.
+
+    Jika T gagal pada langkah ke-j, semua eksponen >= j juga gagal
+    (rantainya sama), jadi tabel berhenti di sana dan panjangnya < n.
+    """
+    table = []
+    result = P
+    curr_s = start_s
+    for _ in range(n):
+        try:
+            result = T(result, curr_s, a, p)
+        except ValueError:
+            break
+        table.append(result)
+        curr_s += 1
+    return table
+
+
 def keygen(p: int, a: int, P0: Tuple[int, int]) -> Tuple[int, Tuple[int, int]]:
     """
     Generasi kunci:
@@ -185,6 +209,84 @@ def encrypt(
         return C1, C2, r
 
 
+def _valid_r_count(table_P0: List[Tuple[int, int]], table_Q: List[Tuple[int, int]], p: int) -> int:
+    """
+    Banyaknya r valid untuk sepasang tabel: r di [1, n] dengan
+    n = min(len(table_P0), len(table_Q), p-1).
+    """
+    n = min(len(table_P0), len(table_Q), p - 1)
+    if n < 1:
+        raise ValueError("Tidak ada r yang valid: T^1(P0) atau T^1(public_Q) gagal.")
+    return n
+
+
+def encrypt_with_table(
+    m: int,
+    table_P0: List[Tuple[int, int]],
+    table_Q: List[Tuple[int, int]],
+    p: int,
+    r: Optional[int] = None,
+) -> Tuple[Tuple[int, int], Tuple[int, int], int]:
+    """
+    Enkripsi seperti encrypt(), tetapi T^r diambil dari tabel prakomputasi:
+      table_P0 = T_table(P0, 1, p-1, a, p)
+      table_Q  = T_table(public_Q, k+1, p-1, a, p)
+
+      1. Jika r tidak diberikan, pilih r random langsung di antara r yang valid
+         (r <= panjang tabel). Distribusinya sama dengan mengulang r di
+         [1, p-1] sampai T^r berhasil, tanpa loop ulang.
+         Jika r diberikan di luar rentang valid, raise ValueError.
+      2. C1 = table_P0[r-1], Sr = table_Q[r-1].
+      3. C2 = (m mod p, 0) + Sr.
+      Return (C1, C2, r).
+    """
+    n_valid = _valid_r_count(table_P0, table_Q, p)
+    if r is None:
+        r = secrets.randbelow(n_valid) + 1
+    elif not 1 <= r <= n_valid:
+        raise ValueError(f"r={r} di luar rentang valid [1, {n_valid}].")
+
+    C1 = table_P0[r - 1]
+    Sr = table_Q[r - 1]
+    C2 = ((m % p + Sr[0]) % p, Sr[1] % p)
+    return C1, C2, r
+
+
+def encrypt_batch(
+    ms: Iterable[int],
+    public_Q: Tuple[int, int],
+    k: int,
+    p: int,
+    a: int,
+    P0: Tuple[int, int],
+    tables: Optional[Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]] = None,
+) -> List[Tuple[int, int, int, int, int]]:
+    """
+    Enkripsi batch untuk banyak blok sekaligus:
+      1. Bangun (atau pakai) tabel T^r untuk P0 dan public_Q sekali saja:
+         tables = (T_table(P0, 1, p-1, a, p), T_table(public_Q, k+1, p-1, a, p)).
+      2. Ambil semua r sekaligus di antara r yang valid.
+      3. Untuk setiap (m, r), jalankan encrypt_with_table.
+      Return list baris datar (C1.x, C1.y, C2.x, C2.y, r), urutan sama dengan ms.
+    """
+    if tables is None:
+        tables = (
+            T_table(P0, start_s=1, n=p - 1, a=a, p=p),
+            T_table(public_Q, start_s=k + 1, n=p - 1, a=a, p=p),
+        )
+    table_P0, table_Q = tables
+
+    ms = list(ms)
+    n_valid = _valid_r_count(table_P0, table_Q, p)
+    rs = [secrets.randbelow(n_valid) + 1 for _ in ms]
+
+    rows = []
+    for m, r in zip(ms, rs):
+        C1, C2, r = encrypt_with_table(m, table_P0, table_Q, p, r=r)
+        rows.append((C1[0], C1[1], C2[0], C2[1], r))
+    return rows
+
+
 def decrypt(
     C1: Tuple[int, int],
     C2: Tuple[int, int],
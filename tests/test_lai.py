@@ -1,5 +1,8 @@
 import pytest
-from pqcrypto.lai import keygen, encrypt, decrypt
+from pqcrypto.lai import (
+    keygen, encrypt, encrypt_with_table, encrypt_batch, decrypt, sqrt_mod,
+    T_table, _pow_T_range,
+)
 
 @pytest.mark.parametrize("p,a,P0", [
     (10007, 5, (1, 0)),
@@ -13,3 +16,64 @@ def test_lai_roundtrip(p, a, P0):
     # dekripsi
     m2 = decrypt(C1, C2, k, a, p)
     assert m2 == m
+
+@pytest.mark.parametrize("p,a,P0", [
+    (10007, 5, (1, 0)),
+])
+def test_lai_encrypt_batch_roundtrip(p, a, P0):
+    k, Q = keygen(p, a, P0)
+    ms = [0, 1, 255, p - 1]
+    rows = encrypt_batch(ms, Q, k, p, a, P0)
+    assert len(rows) == len(ms)
+    for m, (c1x, c1y, c2x, c2y, r) in zip(ms, rows):
+        assert decrypt((c1x, c1y), (c2x, c2y), k, r, a, p) == m
+
+@pytest.mark.parametrize("r", [0, -1, 4, 10007])
+def test_lai_encrypt_with_table_rejects_invalid_r(r):
+    p = 10007
+    table_P0 = [(1, 2), (3, 4), (5, 6), (7, 8)]
+    table_Q = [(9, 10), (11, 12), (13, 14)]
+    with pytest.raises(ValueError):
+        encrypt_with_table(42, table_P0, table_Q, p, r=r)
+
+def test_lai_encrypt_with_table_empty_range():
+    with pytest.raises(ValueError):
+        encrypt_with_table(42, [(1, 2)], [], 10007)
+    with pytest.raises(ValueError):
+        encrypt_batch([42], (1, 2), 1, 10007, 5, (1, 0), tables=([], [(1, 2)]))
+
+@pytest.mark.parametrize("p", [7, 11, 19, 10007, 13, 10009])
+def test_sqrt_mod_matches_legendre(p):
+    # p ≡ 3 (mod 4): 7, 11, 19, 10007; p ≡ 1 (mod 4), Tonelli–Shanks: 13, 10009
+    for x in range(p):
+        root = sqrt_mod(x, p)
+        is_residue = x == 0 or pow(x, (p - 1) // 2, p) == 1
+        if is_residue:
+            assert root is not None and (root * root) % p == x
+        else:
+            assert root is None
+
+@pytest.mark.parametrize("P,start_s", [
+    ((1, 0), 1),
+    ((5236, 945), 544),
+])
+def test_T_table_matches_pow_T_range(P, start_s):
+    p, a = 10007, 5
+    table = T_table(P, start_s, 50, a, p)
+    assert len(table) == 50
+    for r in (1, 2, 17, 50):
+        assert table[r - 1] == _pow_T_range(P, start_s, r, a, p)
+
+@pytest.mark.parametrize("p,a,P0", [
+    (10007, 5, (1, 0)),
+])
+def test_lai_encrypt_with_table_roundtrip(p, a, P0):
+    k, Q = keygen(p, a, P0)
+    table_P0 = T_table(P0, 1, p - 1, a, p)
+    table_Q = T_table(Q, k + 1, p - 1, a, p)
+    for m in (0, 42, p - 1):
+        C1, C2, r = encrypt_with_table(m, table_P0, table_Q, p)
+        assert decrypt(C1, C2, k, r, a, p) == m
+    C1, C2, r = encrypt_with_table(1234, table_P0, table_Q, p, r=1)
+    assert r == 1
+    assert decrypt(C1, C2, k, r, a, p) == 1234
@@ -0,0 +1,33 @@
+import importlib.util
+import os
+
+import pytest
+
+# lai.py is a top-level script, not part of the package: load it by path
+_spec = importlib.util.spec_from_file_location(
+    "lai_script", os.path.join(os.path.dirname(__file__), os.pardir, "lai.py")
+)
+lai_script = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(lai_script)
+
+
+def _blocks_by_slicing(raw, B):
+    return [int.from_bytes(raw[i:i + B], "big") for i in range(0, len(raw), B)]
+
+
+@pytest.mark.parametrize("B", [1, 2, 3, 4, 8, 16])
+def test_buffer_to_int_blocks_matches_from_bytes(B):
+    # Length is not a multiple of B, so the trailing short chunk is exercised
+    raw = bytes((i * 37 + 11) % 256 for i in range(16 * 7 + 5))
+    p = 1 << (8 * B + 1)
+    assert lai_script._buffer_to_int_blocks(raw, p, B) == _blocks_by_slicing(raw, B)
+    assert lai_script._buffer_to_int_blocks(memoryview(raw), p, B) == _blocks_by_slicing(raw, B)
+
+
+@pytest.mark.parametrize("B", [1, 2, 3])
+def test_buffer_to_int_blocks_reports_first_block_at_least_p(B):
+    # Block 1 is the first >= p; block 3 is the largest
+    raw = bytes([0x10] * B + [0x30] * B + [0x20] * B + [0xff] * B)
+    p = int.from_bytes(bytes([0x20] * B), "big")
+    with pytest.raises(ValueError, match=r"block index 1\)"):
+        lai_script._buffer_to_int_blocks(raw, p, B)